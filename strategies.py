@@ -4,10 +4,173 @@ And some handy classes to extend
 """
 
 import chess
+import chess.engine
+import chess.polyglot
+import functools
 import random
+import time
+from collections import OrderedDict, namedtuple
 from engine_wrapper import EngineWrapper
 from model import Game
 
+# Transposition table bound types and the maximum number of stored positions
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+TT_SIZE = 1 << 18
+
+# Depth reduction applied to the null-move search
+NULL_MOVE_R = 2
+
+# Deepest ply the search keeps per-ply data (killer moves) for
+MAX_PLY = 64
+
+# History scores are aged once one exceeds this, keeping them below the killers
+HISTORY_MAX = 7000
+
+# Expected number of moves left in the game, used to split the clock
+MOVES_TO_GO = 40
+
+# Search depth used when there is no clock to stop iterative deepening
+FIXED_DEPTH = 3
+
+# Score of being checkmated at the root; a mate n plies away scores MATE - n
+MATE = 10 ** 9
+# Scores at or beyond this are forced mates
+MATE_BOUND = MATE - MAX_PLY
+
+TTEntry = namedtuple("TTEntry", ["depth", "value", "flag", "move"])
+
+
+class TimeUp(Exception):
+    """Raised inside the search once the deadline for the move has passed"""
+
+# Polyglot Zobrist keys; piece keys are indexed piece_index(piece_type, color) + square
+ZOBRIST = chess.polyglot.ZobristHasher(chess.polyglot.POLYGLOT_RANDOM_ARRAY)
+ZOBRIST_PIECES = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+
+# Piece-square bonuses in centipawns, written from white's side with rank 8 first
+PAWN_TABLE = [
+    0,  0,  0,  0,  0,  0,  0,  0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5,  5, 10, 25, 25, 10,  5,  5,
+    0,  0,  0, 20, 20,  0,  0,  0,
+    5, -5,-10,  0,  0,-10, -5,  5,
+    5, 10, 10,-20,-20, 10, 10,  5,
+    0,  0,  0,  0,  0,  0,  0,  0
+]
+
+KNIGHT_TABLE = [
+    -50,-40,-30,-30,-30,-30,-40,-50,
+    -40,-20,  0,  0,  0,  0,-20,-40,
+    -30,  0, 10, 15, 15, 10,  0,-30,
+    -30,  5, 15, 20, 20, 15,  5,-30,
+    -30,  0, 15, 20, 20, 15,  0,-30,
+    -30,  5, 10, 15, 15, 10,  5,-30,
+    -40,-20,  0,  5,  5,  0,-20,-40,
+    -50,-40,-30,-30,-30,-30,-40,-50
+]
+
+BISHOP_TABLE = [
+    -20,-10,-10,-10,-10,-10,-10,-20,
+    -10,  0,  0,  0,  0,  0,  0,-10,
+    -10,  0,  5, 10, 10,  5,  0,-10,
+    -10,  5,  5, 10, 10,  5,  5,-10,
+    -10,  0, 10, 10, 10, 10,  0,-10,
+    -10, 10, 10, 10, 10, 10, 10,-10,
+    -10,  5,  0,  0,  0,  0,  5,-10,
+    -20,-10,-10,-10,-10,-10,-10,-20
+]
+
+ROOK_TABLE = [
+    0,  0,  0,  0,  0,  0,  0,  0,
+    5, 10, 10, 10, 10, 10, 10,  5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    -5,  0,  0,  0,  0,  0,  0, -5,
+    0,  0,  0,  5,  5,  0,  0,  0
+]
+
+QUEEN_TABLE = [
+    -20,-10,-10, -5, -5,-10,-10,-20,
+    -10,  0,  0,  0,  0,  0,  0,-10,
+    -10,  0,  5,  5,  5,  5,  0,-10,
+    -5,  0,  5,  5,  5,  5,  0, -5,
+    0,  0,  5,  5,  5,  5,  0, -5,
+    -10,  5,  5,  5,  5,  5,  0,-10,
+    -10,  0,  5,  0,  0,  0,  0,-10,
+    -20,-10,-10, -5, -5,-10,-10,-20
+]
+
+KING_MIDDLEGAME_TABLE = [
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -30,-40,-40,-50,-50,-40,-40,-30,
+    -20,-30,-30,-40,-40,-30,-30,-20,
+    -10,-20,-20,-20,-20,-20,-20,-10,
+    20, 20,  0,  0,  0,  0, 20, 20,
+    20, 30, 10,  0,  0, 10, 30, 20
+]
+
+KING_ENDGAME_TABLE = [
+    -50,-40,-30,-20,-20,-30,-40,-50,
+    -30,-20,-10,  0,  0,-10,-20,-30,
+    -30,-10, 20, 30, 30, 20,-10,-30,
+    -30,-10, 30, 40, 40, 30,-10,-30,
+    -30,-10, 30, 40, 40, 30,-10,-30,
+    -30,-10, 20, 30, 30, 20,-10,-30,
+    -30,-30,  0,  0,  0,  0,-30,-30,
+    -50,-30,-30,-30,-30,-30,-30,-50
+]
+
+# Piece values and piece-square tables indexed by [color][piece_type][square],
+# with one set for the middlegame and one for the endgame (only the king differs)
+PIECE_VALUE = (0, 100, 320, 330, 500, 900, 200000)
+
+
+def tables_by_color(tables):
+    """
+    Index a row of tables by color. The tables list rank 8 first while
+    python-chess counts squares from a1, so black reads them as they are
+    and white through square ^ 56, which flips the rank but not the file.
+    """
+    return (
+        (None,) + tuple(tuple(table) for table in tables),
+        (None,) + tuple(tuple(table[square ^ 56] for square in chess.SQUARES) for table in tables),
+    )
+
+
+PST_MG = tables_by_color(
+    [PAWN_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEN_TABLE, KING_MIDDLEGAME_TABLE])
+PST_EG = tables_by_color(
+    [PAWN_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEN_TABLE, KING_ENDGAME_TABLE])
+
+
+def piece_index(piece_type, color):
+    """Offset of a piece's 64 squares in ZOBRIST_PIECES and the SCORE tables"""
+    return 64 * ((piece_type - 1) * 2 + color)
+
+
+def signed_scores(pst):
+    """
+    Fold PIECE_VALUE into a piece-square table set, negated for black, so
+    a piece's whole contribution to the evaluation is a single lookup.
+    The result is flat and laid out like the Polyglot piece keys.
+    """
+    return tuple(
+        (1 if color == chess.WHITE else -1) * (PIECE_VALUE[piece_type] + bonus)
+        for piece_type in chess.PIECE_TYPES
+        for color in (chess.BLACK, chess.WHITE)
+        for bonus in pst[color][piece_type])
+
+
+SCORE_MG = signed_scores(PST_MG)
+SCORE_EG = signed_scores(PST_EG)
+
 
 class FillerEngine:
     """
@@ -24,13 +187,10 @@ class FillerEngine:
         self.main_engine = main_engine
 
     def __getattr__(self, method_name):
-        main_engine = self.main_engine
-
-        def method(*args, **kwargs):
-            nonlocal main_engine
-            nonlocal method_name
-            return main_engine.notify(method_name, *args, **kwargs)
-
+        # Only called for missing attributes: keep the method on the
+        # instance so later lookups of the same name find it directly
+        method = functools.partial(self.main_engine.notify, method_name)
+        setattr(self, method_name, method)
         return method
 
 
@@ -86,268 +246,483 @@ class ExampleEngine(MinimalEngine):
     pass
 
 class Move(ExampleEngine):
-    pawnWhiteTable = [
-        0,  0,  0,  0,  0,  0,  0,  0,
-        50, 50, 50, 50, 50, 50, 50, 50,
-        10, 10, 20, 30, 30, 20, 10, 10,
-        5,  5, 10, 25, 25, 10,  5,  5,
-        0,  0,  0, 20, 20,  0,  0,  0,
-        5, -5,-10,  0,  0,-10, -5,  5,
-        5, 10, 10,-20,-20, 10, 10,  5,
-        0,  0,  0,  0,  0,  0,  0,  0
-    ]
-    pawnBlackTable = list(reversed(pawnWhiteTable))
-
-    knightWhiteTable = [
-        -50,-40,-30,-30,-30,-30,-40,-50,
-        -40,-20,  0,  0,  0,  0,-20,-40,
-        -30,  0, 10, 15, 15, 10,  0,-30,
-        -30,  5, 15, 20, 20, 15,  5,-30,
-        -30,  0, 15, 20, 20, 15,  0,-30,
-        -30,  5, 10, 15, 15, 10,  5,-30,
-        -40,-20,  0,  5,  5,  0,-20,-40,
-        -50,-40,-30,-30,-30,-30,-40,-50
-    ]
-    knightBlackTable = list(reversed(knightWhiteTable))
-
-    bishopWhiteTable = [
-        -20,-10,-10,-10,-10,-10,-10,-20,
-        -10,  0,  0,  0,  0,  0,  0,-10,
-        -10,  0,  5, 10, 10,  5,  0,-10,
-        -10,  5,  5, 10, 10,  5,  5,-10,
-        -10,  0, 10, 10, 10, 10,  0,-10,
-        -10, 10, 10, 10, 10, 10, 10,-10,
-        -10,  5,  0,  0,  0,  0,  5,-10,
-        -20,-10,-10,-10,-10,-10,-10,-20
-    ]
-    bishopBlackTable = list(reversed(bishopWhiteTable))
-
-    rookWhiteTable = [
-        0,  0,  0,  0,  0,  0,  0,  0,
-        5, 10, 10, 10, 10, 10, 10,  5,
-        -5,  0,  0,  0,  0,  0,  0, -5,
-        -5,  0,  0,  0,  0,  0,  0, -5,
-        -5,  0,  0,  0,  0,  0,  0, -5,
-        -5,  0,  0,  0,  0,  0,  0, -5,
-        -5,  0,  0,  0,  0,  0,  0, -5,
-        0,  0,  0,  5,  5,  0,  0,  0
-    ]
-    rookBlackTable = list(reversed(rookWhiteTable))
-
-    queenWhiteTable = [
-        -20,-10,-10, -5, -5,-10,-10,-20,
-        -10,  0,  0,  0,  0,  0,  0,-10,
-        -10,  0,  5,  5,  5,  5,  0,-10,
-        -5,  0,  5,  5,  5,  5,  0, -5,
-        0,  0,  5,  5,  5,  5,  0, -5,
-        -10,  5,  5,  5,  5,  5,  0,-10,
-        -10,  0,  5,  0,  0,  0,  0,-10,
-        -20,-10,-10, -5, -5,-10,-10,-20
-    ]
-    queenBlackTable = list(reversed(queenWhiteTable))
-
-    kingWhiteMiddlegameTable = [
-        -30,-40,-40,-50,-50,-40,-40,-30,
-        -30,-40,-40,-50,-50,-40,-40,-30,
-        -30,-40,-40,-50,-50,-40,-40,-30,
-        -30,-40,-40,-50,-50,-40,-40,-30,
-        -20,-30,-30,-40,-40,-30,-30,-20,
-        -10,-20,-20,-20,-20,-20,-20,-10,
-        20, 20,  0,  0,  0,  0, 20, 20,
-        20, 30, 10,  0,  0, 10, 30, 20
-    ]
-    kingBlackMiddlegameTable = list(reversed(kingWhiteMiddlegameTable))
-
-    kingWhiteEndgameTable = [
-        -50,-40,-30,-20,-20,-30,-40,-50,
-        -30,-20,-10,  0,  0,-10,-20,-30,
-        -30,-10, 20, 30, 30, 20,-10,-30,
-        -30,-10, 30, 40, 40, 30,-10,-30,
-        -30,-10, 30, 40, 40, 30,-10,-30,
-        -30,-10, 20, 30, 30, 20,-10,-30,
-        -30,-30,  0,  0,  0,  0,-30,-30,
-        -50,-30,-30,-30,-30,-30,-30,-50
-    ]
-    kingBlackEndgameTable = list(reversed(kingWhiteEndgameTable))
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tt = OrderedDict()
+        self.eval_mg = 0
+        self.eval_eg = 0
+        self.piece_key = 0
+        self.mailbox = [None] * 64
+        self.incremental = True
+        self.undo_stack = []
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [0] * 64 * 64
+        self.deadline = None
+        # Cleared at the first book miss; one engine plays one game
+        self.in_book = True
 
     def check_end_game(self, board):
-        queens = 0
-        minors = 0
+        return not board.queens or (
+            chess.popcount(board.queens) == 2 and chess.popcount(board.knights | board.bishops) <= 1)
 
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if piece and piece.piece_type == chess.QUEEN:
-                queens += 1
-            if piece and (piece.piece_type == chess.BISHOP or piece.piece_type == chess.KNIGHT):
-                minors += 1
-
-        if queens == 0 or (queens == 2 and minors <= 1):
-            return True
+    def evaluate_board(self, board, scores=None):
+        total = 0
+        if scores is None:
+            scores = SCORE_EG if self.check_end_game(board) else SCORE_MG
+
+        # Walk the occupied squares of each piece bitboard, lowest bit first
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                base = piece_index(piece_type, color) - 1
+                bb = board.pieces_mask(piece_type, color)
+                while bb:
+                    total += scores[base + (bb & -bb).bit_length()]
+                    bb &= bb - 1
 
-        return False
+        return total
 
-    def piece_value(self, piece):
-        if piece == None:
-            return 0
+    def reset_position(self, board):
+        """Seed the incrementally updated scores and hash from the board"""
+        # move_changes only knows standard chess moves: drops, explosions
+        # and the like are handled by rescanning the board after each move
+        self.incremental = board.uci_variant == "chess"
+        self.refresh_position(board)
+        self.undo_stack = []
+
+    def refresh_position(self, board):
+        """Recompute the scores, the piece part of the hash and the mailbox"""
+        self.eval_mg = self.evaluate_board(board, SCORE_MG)
+        self.eval_eg = self.evaluate_board(board, SCORE_EG)
+        self.piece_key = ZOBRIST.hash_board(board)
+        self.mailbox = [board.piece_type_at(square) for square in chess.SQUARES]
+
+    def current_eval(self, board):
+        return self.eval_eg if self.check_end_game(board) else self.eval_mg
+
+    def relative_eval(self, board):
+        """current_eval from the point of view of the side to move"""
+        score = self.current_eval(board)
+        return score if board.turn == chess.WHITE else -score
+
+    def move_changes(self, board, move):
+        """
+        List the (color, piece_type, square, +1/-1) placements a move adds
+        to or removes from the board, before it is pushed.
+        """
+        mailbox = self.mailbox
+        color = board.turn
+        piece_type = mailbox[move.from_square]
+        to_square = move.to_square
+        changes = [(color, piece_type, move.from_square, -1)]
+
+        if board.is_castling(move):
+            rank = chess.square_rank(move.from_square)
+            kingside = board.is_kingside_castling(move)
+            # Chess960 castling is encoded as the king capturing its own rook
+            rook_from = to_square if board.chess960 else chess.square(7 if kingside else 0, rank)
+            changes.append((color, chess.KING, chess.square(6 if kingside else 2, rank), 1))
+            changes.append((color, chess.ROOK, rook_from, -1))
+            changes.append((color, chess.ROOK, chess.square(5 if kingside else 3, rank), 1))
+            return changes
+
+        if board.is_en_passant(move):
+            captured_square = to_square - 8 if color == chess.WHITE else to_square + 8
+            changes.append((not color, chess.PAWN, captured_square, -1))
+        else:
+            captured = mailbox[to_square]
+            if captured:
+                changes.append((not color, captured, to_square, -1))
 
-        if piece.piece_type == chess.PAWN:
-            return 100
-        if piece.piece_type == chess.KNIGHT:
-            return 320
-        if piece.piece_type == chess.BISHOP:
-            return 330
-        if piece.piece_type == chess.ROOK:
-            return 500
-        if piece.piece_type == chess.QUEEN:
-            return 900
-        if piece.piece_type == chess.KING:
-            return 200000
-        
-        return 0
-
-    def eval_piece(self, piece, square, endgame):
-        if piece == None:
-            return 0
+        changes.append((color, move.promotion or piece_type, to_square, 1))
+        return changes
 
-        mapping = []
-
-        if piece.piece_type == chess.PAWN:
-            mapping = self.pawnWhiteTable if piece.color == chess.WHITE else self.pawnBlackTable
-        if piece.piece_type == chess.KNIGHT:
-            mapping = self.knightWhiteTable if piece.color == chess.WHITE else self.knightBlackTable
-        if piece.piece_type == chess.BISHOP:
-            mapping = self.bishopWhiteTable if piece.color == chess.WHITE else self.bishopBlackTable
-        if piece.piece_type == chess.ROOK:
-            mapping = self.rookWhiteTable if piece.color == chess.WHITE else self.rookBlackTable
-        if piece.piece_type == chess.QUEEN:
-            mapping = self.queenWhiteTable if piece.color == chess.WHITE else self.queenBlackTable
-        if piece.piece_type == chess.KING:
-            if endgame:
-                mapping = (
-                    self.kingWhiteEndgameTable if piece.color == chess.WHITE else self.kingBlackEndgameTable
-                )
-            else:
-                mapping = self.kingWhiteMiddlegameTable if piece.color == chess.WHITE else self.kingBlackMiddlegameTable
-        
-        return mapping[square]
-
-    def evaluate_board(self, board):
-        total = 0
+    def push_move(self, board, move):
+        """
+        board.push, keeping eval_mg / eval_eg, the piece part of the
+        Zobrist hash and the mailbox up to date incrementally
+        """
+        if not self.incremental:
+            self.undo_stack.append((self.eval_mg, self.eval_eg, self.piece_key, self.mailbox))
+            board.push(move)
+            self.refresh_position(board)
+            return
+
+        # Null moves change nothing but the side to move
+        changes = self.move_changes(board, move) if move else ()
+        self.undo_stack.append((self.eval_mg, self.eval_eg, self.piece_key, changes))
+        for color, piece_type, square, sign in changes:
+            # piece_index, inlined on this hot path
+            index = 64 * ((piece_type - 1) * 2 + color) + square
+            self.piece_key ^= ZOBRIST_PIECES[index]
+            self.eval_mg += sign * SCORE_MG[index]
+            self.eval_eg += sign * SCORE_EG[index]
+        self.apply_changes(changes)
+        board.push(move)
+
+    def pop_move(self, board):
+        board.pop()
+        self.eval_mg, self.eval_eg, self.piece_key, changes = self.undo_stack.pop()
+        if not self.incremental:
+            # The saved mailbox of the previous position
+            self.mailbox = changes
+            return
+        self.apply_changes(changes, -1)
+
+    def apply_changes(self, changes, direction=1):
+        """
+        Update the mailbox from move_changes output, or undo it with
+        direction -1. Removals go first, as a chess960 castling rook can
+        land where its king stood.
+        """
+        mailbox = self.mailbox
+        for _, _, square, sign in changes:
+            if sign != direction:
+                mailbox[square] = None
+        for _, piece_type, square, sign in changes:
+            if sign == direction:
+                mailbox[square] = piece_type
+
+    def zobrist_key(self, board):
+        """
+        Polyglot Zobrist hash of the board: the incrementally kept piece
+        part, plus castling rights, en passant file and turn.
+        Variant boards are keyed by their EPD instead, which also holds
+        the pockets and remaining checks the Polyglot hash leaves out.
+        """
+        if not self.incremental:
+            return board.epd()
+        return (self.piece_key ^ ZOBRIST.hash_castling(board)
+                ^ ZOBRIST.hash_ep_square(board) ^ ZOBRIST.hash_turn(board))
 
-        for square in chess.SQUARES:
-            piece = board.piece_at(square)
-            if not piece:
+    def tt_probe(self, board, ply):
+        """
+        Look the board up in the transposition table. Mate scores are stored
+        relative to the node, so they are turned back into distances from
+        the root at this ply.
+        """
+        key = self.zobrist_key(board)
+        entry = self.tt.get(key)
+        if entry is not None:
+            self.tt.move_to_end(key)
+            if entry.value >= MATE_BOUND:
+                entry = entry._replace(value=entry.value - ply)
+            elif entry.value <= -MATE_BOUND:
+                entry = entry._replace(value=entry.value + ply)
+        return key, entry
+
+    def tt_store(self, key, depth, value, flag, move, ply):
+        if value >= MATE_BOUND:
+            value += ply
+        elif value <= -MATE_BOUND:
+            value -= ply
+        self.tt[key] = TTEntry(depth, value, flag, move)
+        self.tt.move_to_end(key)
+        if len(self.tt) > TT_SIZE:
+            self.tt.popitem(last=False)
+
+    def order_moves(self, board, moves, tt_move=None, ply=None):
+        """
+        Sort moves in place so the TT move is tried first, then captures
+        in MVV-LVA order (most valuable victim, least valuable attacker),
+        then the killer moves of this ply, then quiet moves by history score.
+        Piece types are numbered by value, so they are used directly.
+        """
+        killer_1, killer_2 = self.killers[ply] if ply is not None else (None, None)
+        history = self.history
+        # The key runs for every move of every node, so it avoids method
+        # calls and Move.__eq__ wherever a plain int test will do
+        them = board.occupied_co[not board.turn]
+        pawns = board.pawns
+        ep_square = board.ep_square
+        mailbox = self.mailbox
+
+        def score(move):
+            from_square = move.from_square
+            to_square = move.to_square
+            if tt_move is not None and move == tt_move:
+                return 1000000
+            if them & chess.BB_SQUARES[to_square]:
+                return 10000 + 10 * mailbox[to_square] - mailbox[from_square]
+            if to_square == ep_square and pawns & chess.BB_SQUARES[from_square]:
+                # En passant: a pawn takes a pawn
+                return 10000 + 10 * chess.PAWN - chess.PAWN
+            if killer_1 is not None and move == killer_1:
+                return 9000
+            if killer_2 is not None and move == killer_2:
+                return 8000
+            return history[from_square * 64 + to_square]
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def has_non_pawn_material(self, board, color):
+        return bool(board.occupied_co[color] & ~(board.pawns | board.kings))
+
+    def quiesce(self, board, alpha, beta):
+        """
+        Search captures only until the position is quiet, so leaves are
+        never scored in the middle of an exchange.
+        """
+        stand_pat = self.relative_eval(board)
+        if stand_pat >= beta:
+            return beta
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        for move in self.order_moves(board, list(board.generate_legal_captures())):
+            # Skip captures of a cheaper piece on a defended square
+            victim = self.mailbox[move.to_square] or chess.PAWN
+            attacker = self.mailbox[move.from_square]
+            if (PIECE_VALUE[attacker] > PIECE_VALUE[victim]
+                    and board.is_attacked_by(not board.turn, move.to_square)):
                 continue
-            
-            endgame = self.check_end_game(board)
-            value = self.piece_value(piece) + self.eval_piece(piece, square, endgame)
-            total += value if piece.color == chess.WHITE else -value
-        
-        return total
 
-    def minimax(self, depth, board, alpha, beta, is_maximising_player):
-        if board.is_checkmate():
-            return -float("inf") if is_maximising_player else float("inf")
-        elif board.is_game_over():
+            self.push_move(board, move)
+            score = -self.quiesce(board, -beta, -alpha)
+            self.pop_move(board)
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+
+        return alpha
+
+    def store_killer(self, move, ply):
+        killers = self.killers[ply]
+        if move != killers[0]:
+            killers[1] = killers[0]
+            killers[0] = move
+
+    def store_history(self, move, depth):
+        index = move.from_square * 64 + move.to_square
+        self.history[index] += depth * depth
+        if self.history[index] > HISTORY_MAX:
+            # Age every entry so the scores stay below the killer slots
+            self.history = [value >> 4 for value in self.history]
+
+    def lacks_mating_material(self, board):
+        """Only bare kings, or kings and a single minor piece, are left"""
+        # Variants can still be won from there, e.g. with pieces in hand
+        return (self.incremental and not (board.pawns | board.rooks | board.queens)
+                and chess.popcount(board.occupied) <= 3)
+
+    def negamax(self, depth, board, alpha, beta, ply):
+        """
+        Alpha-beta search in negamax form: scores are always from the point
+        of view of the side to move, so every node maximises.
+        """
+        if not self.incremental and board.is_variant_end():
+            # e.g. an exploded king or a third check
+            if board.is_variant_loss():
+                return -MATE + ply
+            return MATE - ply if board.is_variant_win() else 0
+        if depth == 0:
+            return self.quiesce(board, alpha, beta)
+
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TimeUp
+
+        if self.lacks_mating_material(board):
             return 0
 
-        if depth == 0:
-            return self.evaluate_board(board)
-
-        if is_maximising_player:
-            best_move = -float("inf")
-            moves = (list(board.legal_moves))
-            for move in moves:
-                board.push(move)
-                best_move = max(
-                    best_move,
-                    self.minimax(depth - 1, board, alpha, beta, not is_maximising_player),
-                )
-                board.pop()
-                alpha = max(alpha, best_move)
-                if beta <= alpha:
-                    return best_move
-            return best_move
+        key, entry = self.tt_probe(board, ply)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry.move
+            if entry.depth >= depth:
+                if entry.flag == TT_EXACT:
+                    return entry.value
+                elif entry.flag == TT_LOWER:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value
+
+        # Null-move pruning: if passing still fails high, a real move will too
+        if (depth >= 3 and beta < MATE_BOUND and not board.is_check()
+                and self.has_non_pawn_material(board, board.turn)):
+            self.push_move(board, chess.Move.null())
+            score = -self.negamax(depth - 1 - NULL_MOVE_R, board, -beta, -beta + 1, ply + 1)
+            self.pop_move(board)
+            if score >= beta:
+                # A mate found while passing is not a real one
+                return beta
+
+        alpha_orig = alpha
+        moves = list(board.legal_moves)
+        if not moves:
+            # Checkmate or stalemate
+            return -MATE + ply if board.is_check() else 0
+        moves = self.order_moves(board, moves, tt_move, ply)
+        best_value = -MATE
+        best_move_found = moves[0]
+
+        for move in moves:
+            self.push_move(board, move)
+            value = -self.negamax(depth - 1, board, -beta, -alpha, ply + 1)
+            self.pop_move(board)
+            if value > best_value:
+                best_value = value
+                best_move_found = move
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        if not board.is_capture(move):
+                            self.store_killer(move, ply)
+                            self.store_history(move, depth)
+                        break
+
+        if best_value <= alpha_orig:
+            flag = TT_UPPER
+        elif best_value >= beta:
+            flag = TT_LOWER
         else:
-            best_move = float("inf")
-            moves = (list(board.legal_moves))
-            for move in moves:
-                board.push(move)
-                best_move = min(
-                    best_move,
-                    self.minimax(depth - 1, board, alpha, beta, not is_maximising_player),
-                )
-                board.pop()
-                beta = min(beta, best_move)
-                if beta <= alpha:
-                    return best_move
-            return best_move
-
-    def minimax_root(self, depth, board):
-        maximize = board.turn == chess.WHITE
-        best_move = -float("inf")
-        if not maximize:
-            best_move = float("inf")
-
-        moves = (list(board.legal_moves))
+            flag = TT_EXACT
+        self.tt_store(key, depth, best_value, flag, best_move_found, ply)
+        return best_value
+
+    def time_budget(self, timeleft):
+        """Seconds to spend on this move, or None when there is no clock."""
+        if isinstance(timeleft, chess.engine.Limit):
+            return timeleft.time
+        if timeleft:
+            return timeleft / 1000 / MOVES_TO_GO
+        return None
+
+    def minimax_root(self, depth, board, deadline=None):
+        self.reset_position(board)
+        self.killers = [[None, None] for _ in range(MAX_PLY)]
+        self.history = [0] * 64 * 64
+
+        key, entry = self.tt_probe(board, 0)
+        moves = self.order_moves(board, list(board.legal_moves), entry.move if entry is not None else None)
         best_move_found = moves[0]
+        if len(moves) == 1:
+            return best_move_found
 
+        # can_claim_draw generates and plays every reply, so find the root
+        # moves that allow a draw claim once rather than on every pass
+        drawn = set()
         for move in moves:
             board.push(move)
             if board.can_claim_draw():
-                value = 0.0
-            else:
-                value = self.minimax(depth - 1, board, -float("inf"), float("inf"), not maximize)
+                drawn.add(move)
             board.pop()
-            if maximize and value >= best_move:
-                best_move = value
-                best_move_found = move
-            elif not maximize and value <= best_move:
-                best_move = value
-                best_move_found = move
 
+        # Root results depend on the game so far once a draw can be
+        # claimed, so they are neither reused nor stored then
+        if (not drawn and entry is not None and entry.flag == TT_EXACT
+                and entry.depth >= depth and entry.move == best_move_found):
+            # Already searched this deep, e.g. in an earlier search of the game
+            return best_move_found
+
+        # Iterative deepening: each pass tries the previous best move first.
+        # The first pass only runs quiescence, so it always completes and
+        # there is a move to fall back on when a deeper pass runs out of time.
+        self.deadline = deadline
+        root_ply = len(board.move_stack)
+        for current_depth in range(1, depth + 1):
+            moves.sort(key=lambda m: 0 if m == best_move_found else 1)
+            best_value = -MATE
+            iteration_best = moves[0]
+
+            try:
+                for move in moves:
+                    if move in drawn:
+                        value = 0
+                    else:
+                        self.push_move(board, move)
+                        value = -self.negamax(current_depth - 1, board, -MATE, -best_value, 1)
+                        self.pop_move(board)
+                    if value > best_value:
+                        best_value = value
+                        iteration_best = move
+                        if best_value >= MATE_BOUND:
+                            # Stop at the first forced mate: iterative
+                            # deepening finds the shortest one first
+                            break
+            except TimeUp:
+                # Unwind the moves the aborted pass left on the board
+                while len(board.move_stack) > root_ply:
+                    self.pop_move(board)
+                break
+
+            best_move_found = iteration_best
+            if not drawn:
+                self.tt_store(key, current_depth, best_value, TT_EXACT, best_move_found, 0)
+            if best_value >= MATE_BOUND:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+        self.deadline = None
         return best_move_found
 
-    def is_equivalent(self, fen, board2):
-        board1 = chess.Board(fen)
-        for square in chess.SQUARES :
-            if board1.piece_at(square) != board2.piece_at(square):
-                return False
-        return True
-
-    def move_from_book(self, board):
-        tscp_op = [['g1f3', 'g8f6', 'c2c4', 'b7b6', 'g2g3'], ['g1f3', 'g8f6', 'c2c4', 'c7c5', 'b1c3', 'b8c6'], ['g1f3', 'g8f6', 'c2c4', 'c7c5', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['g1f3', 'g8f6', 'c2c4', 'c7c5', 'g2g3'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'b8d7'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8b4'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'c1g5'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c5'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'g2g3', 'd7d5', 'f1g2', 'f8e7'], ['g1f3', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4'], ['g1f3', 'g8f6', 'c2c4', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['g1f3', 'g8f6', 'd2d4', 'c7c5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'e2e3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'g2g3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'f8b4', 'b1d2'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'f8b4', 'c1d2'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'f8b4'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'b8d7'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8b4'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'g2g3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'g2g3'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'c2c4', 'f8g7', 'b1c3', 'e8g8', 'e2e4', 'd7d6', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'c2c4', 'f8g7', 'g2g3', 'e8g8', 'f1g2', 'd7d6', 'e1g1'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['g1f3', 'g8f6', 'g2g3', 'g7g6'], ['g1f3', 'c7c5', 'c2c4', 'b8c6'], ['g1f3', 'c7c5', 'c2c4', 'g8f6', 'b1c3', 'b8c6'], ['g1f3', 'c7c5', 'c2c4', 'g8f6', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['g1f3', 'c7c5', 'c2c4', 'g8f6', 'g2g3'], ['g1f3', 'd7d5', 'c2c4'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'e2e3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'c1g5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'g2g3'], ['g1f3', 'd7d5', 'g2g3'], ['g1f3', 'g7g6'], ['c2c4', 'g8f6', 'b1c3', 'c7c5'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'b8d7'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8b4'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c6', 'c1g5'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c5'], ['c2c4', 'g8f6', 'b1c3', 'e7e5', 'g1f3', 'b8c6', 'g2g3'], ['c2c4', 'g8f6', 'b1c3', 'g7g6'], ['c2c4', 'g8f6', 'g1f3', 'b7b6', 'g2g3'], ['c2c4', 'g8f6', 'g1f3', 'c7c5', 'b1c3', 'b8c6'], ['c2c4', 'g8f6', 'g1f3', 'c7c5', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['c2c4', 'g8f6', 'g1f3', 'c7c5', 'g2g3'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'b8d7'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8b4'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'c1g5'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c5'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'g2g3', 'd7d5', 'f1g2', 'f8e7'], ['c2c4', 'g8f6', 'g1f3', 'g7g6', 'b1c3', 'f8g7', 'e2e4'], ['c2c4', 'g8f6', 'g1f3', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['c2c4', 'c7c6'], ['c2c4', 'c7c5', 'g1f3', 'b8c6'], ['c2c4', 'c7c5', 'g1f3', 'g8f6', 'b1c3', 'b8c6'], ['c2c4', 'c7c5', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['c2c4', 'c7c5', 'g1f3', 'g8f6', 'g2g3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'g1f3', 'g8f6', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'c1g5', 'f8e7', 'e2e3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'b8d7'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8b4'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c6', 'c1g5'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c6',
-        'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c5'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'c4d5', 'e6d5', 'c1g5'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6'], ['c2c4', 'e7e6', 'g1f3'], ['c2c4', 'e7e5', 'b1c3', 'b8c6'], ['c2c4', 'e7e5', 'b1c3', 'g8f6', 'g1f3', 'b8c6', 'g2g3'], ['c2c4', 'e7e5', 'g2g3'], ['c2c4', 'g7g6', 'b1c3'], ['d2d4', 'g8f6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'c7c5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'e2e3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'g2g3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'f8b4', 'b1d2'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'f8b4', 'c1d2'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'b8d7'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'g2g3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'g2g3'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'c2c4', 'f8g7', 'b1c3', 'e8g8', 'e2e4', 'd7d6', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'c2c4', 'f8g7', 'g2g3', 'e8g8', 'f1g2', 'd7d6', 'e1g1'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['d2d4', 'g8f6', 'c2c4', 'c7c5', 'd4d5', 'b7b5', 'c4b5', 'a7a6'], ['d2d4', 'g8f6', 'c2c4', 'c7c5', 'd4d5', 'e7e6', 'b1c3', 'e6d5', 'c4d5', 'd7d6'], ['d2d4', 'g8f6', 'c2c4', 'd7d6', 'b1c3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'd1c2', 'e8g8'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'g1f3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'e2e3', 'c7c5', 'f1d3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'e2e3', 'e8g8', 'f1d3', 'd7d5', 'g1f3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'c1g5', 'f8e7', 'e2e3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'b8d7'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8b4'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'c4d5', 'e6d5', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'f8b4', 'b1d2'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'f8b4', 'c1d2'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'b8d7'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'g2g3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g2g3', 'd7d5', 'f1g2'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'f1e2', 'e8g8', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'f1e2', 'e8g8', 'g1f3', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'g1f3', 'e8g8', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'f2f3', 'e8g8', 'c1e3'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'd7d5', 'g1f3', 'f8g7', 'd1b3', 'd5c4', 'b3c4'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'd7d5', 'c4d5', 'f6d5', 'e2e4', 'd5c3', 'b2c3', 'f8g7', 'f1c4'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'g1f3', 'f8g7', 'b1c3', 'e8g8', 'e2e4', 'd7d6', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'g1f3', 'f8g7', 'g2g3', 'e8g8', 'f1g2', 'd7d6', 'e1g1'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['d2d4', 'd7d6', 'e2e4', 'g8f6', 'b1c3', 'g7g6', 'f2f4', 'f8g7', 'g1f3'], ['d2d4', 'd7d6', 'e2e4', 'g7g6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'e2e3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'g2g3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4',
-        'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'd5c4', 'g1f3', 'g8f6', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'g1f3', 'g8f6', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c1g5', 'f8e7', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'b8d7'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8b4'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c4d5', 'e6d5', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'b8d7'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8b4'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'g2g3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'd1c2', 'e8g8'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'g1f3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'e2e3', 'b7b6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'e2e3', 'c7c5', 'f1d3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'e2e3', 'e8g8', 'f1d3', 'd7d5', 'g1f3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'c1g5', 'f8e7', 'e2e3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'b8d7'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8b4'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'c4d5', 'e6d5', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'f8b4', 'b1d2'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'f8b4', 'c1d2'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'b1c3', 'f8b4'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'b8d7'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8b4'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'g2g3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g2g3', 'd7d5', 'f1g2'], ['d2d4', 'f7f5'], ['d2d4', 'g7g6'], ['e2e4', 'g8f6', 'e4e5', 'f6d5', 'd2d4', 'd7d6', 'g1f3'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1c3', 'd5e4', 'c3e4', 'b8d7'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1c3', 'd5e4', 'c3e4', 'c8f5', 'e4g3', 'f5g6', 'h2h4', 'h7h6'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1d2', 'd5e4', 'd2e4', 'b8d7'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1d2', 'd5e4', 'd2e4', 'c8f5', 'e4g3', 'f5g6', 'h2h4', 'h7h6'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'e4d5', 'c6d5', 'c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'e4e5', 'c8f5'], ['e2e4', 'c7c5', 'b1c3', 'b8c6', 'g2g3', 'g7g6', 'f1g2', 'f8g7'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'f1b5'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'c1g5', 'e7e6', 'd1d2', 'f8e7', 'e1c1', 'e8g8'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'c1g5', 'e7e6', 'd1d2', 'a7a6', 'e1c1', 'h7h6'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'f1c4'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'e7e5', 'd4b5', 'd7d6'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'e7e6', 'b1c3', 'd8c7'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'e7e6', 'b1c3', 'a7a6'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g7g6'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'f1b5'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'b8c6', 'c1g5', 'e7e6', 'd1d2', 'f8e7', 'e1c1', 'e8g8'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'b8c6', 'c1g5', 'e7e6', 'd1d2', 'a7a6', 'e1c1', 'h7h6'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'b8c6', 'f1c4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'c1e3'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'c1g5', 'e7e6', 'f2f4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'f1e2', 'e7e5', 'd4b3', 'f8e7'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'f2f4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'e7e6', 'f1e2'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'e7e6', 'g2g4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'g7g6', 'c1e3', 'f8g7', 'f2f3'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'b1c3'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'b8c6', 'b1c3', 'd8c7'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'b8c6', 'b1c3', 'a7a6'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'f1e2'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'g2g4'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'a7a6', 'f1d3'], ['e2e4', 'c7c5', 'c2c3'], ['e2e4', 'd7d6', 'd2d4', 'g8f6', 'b1c3', 'g7g6', 'f2f4', 'f8g7', 'g1f3'], ['e2e4', 'd7d6', 'd2d4', 'g7g6'], ['e2e4', 'd7d5', 'e4d5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1c3', 'f8b4', 'e4e5', 'c7c5', 'a2a3', 'b4c3', 'b2c3', 'g8e7'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1c3', 'g8f6', 'c1g5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1d2', 'g8f6', 'e4e5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1d2', 'c7c5', 'g1f3'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1d2', 'c7c5', 'e4d5', 'e6d5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'e4e5', 'c7c5', 'c2c3', 'b8c6', 'g1f3'], ['e2e4', 'e7e5', 'b1c3'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'g8f6', 'f1b5'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'f8c5'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'g8f6'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'g8f6', 'e1g1'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5c6', 'd7c6', 'e1g1'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'd7d6', 'c2c3', 'e8g8', 'h2h3', 'c6b8', 'd2d4', 'b8d7'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'd7d6', 'c2c3', 'e8g8', 'h2h3', 'c6a5',
-        'b3c2', 'c7c5', 'd2d4', 'd8c7', 'b1d2'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'd7d6', 'c2c3', 'e8g8', 'h2h3', 'c8b7', 'd2d4', 'f8e8'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'e8g8', 'c2c3', 'd7d6', 'h2h3', 'c6b8', 'd2d4', 'b8d7'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'e8g8', 'c2c3', 'd7d6', 'h2h3', 'c6a5', 'b3c2', 'c7c5', 'd2d4', 'd8c7', 'b1d2'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'e8g8', 'c2c3', 'd7d6', 'h2h3', 'c8b7', 'd2d4', 'f8e8'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f6e4', 'd2d4', 'b7b5', 'a4b3', 'd7d5', 'd4e5', 'c8e6', 'c2c3'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'd7d6'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'd2d4', 'e5d4', 'f3d4'], ['e2e4', 'e7e5', 'g1f3', 'g8f6', 'f3e5', 'd7d6', 'e5f3', 'f6e4', 'd2d4'], ['e2e4', 'e7e5', 'f2f4'], ['e2e4', 'g7g6', 'd2d4', 'f8g7', 'b1c3', 'd7d6'], ['g2g3']]
-
-        book = [[[chess.Board().fen(), 'e2e4']]]
-        for openning in tscp_op :
-            board = chess.Board()
-            Openning = []
-            for move in openning :
-                board.push(chess.Move.from_uci(move))
-                a = board.fen()
-                try :
-                    Move = openning[openning.index(move)+1]
-                except Exception :
-                    Move = None
-                Openning.append([a, Move])
-            book.append(Openning)
-
-        liste = []
-        for start in book :
-            for couple in start :
-                if self.is_equivalent(couple[0], board):
-                    liste.append(couple[1])
-        try :
-            return random.choice(liste)
-        except Exception :
-            return None
-
     def search(self, board, *args):
-        move = self.move_from_book(board)
-        if move != None:
-            return move 
-        else:
-            return self.minimax_root(3, board)
\ No newline at end of file
+        # The book holds standard chess lines; its Polyglot keys ignore the variant
+        if self.in_book and board.uci_variant == "chess" and len(board.move_stack) <= BOOK_DEPTH:
+            moves = BOOK_MOVES.get(chess.polyglot.zobrist_hash(board))
+            if moves:
+                return random.choice(moves)
+        self.in_book = False
+        deadline = None
+        budget = self.time_budget(args[0]) if args else None
+        if budget:
+            deadline = time.monotonic() + budget
+        if deadline is None:
+            return self.minimax_root(FIXED_DEPTH, board)
+        return self.minimax_root(MAX_PLY - 1, board, deadline)
+
+
+# Opening lines as UCI moves from the standard starting position
+TSCP_OPENINGS = [['g1f3', 'g8f6', 'c2c4', 'b7b6', 'g2g3'], ['g1f3', 'g8f6', 'c2c4', 'c7c5', 'b1c3', 'b8c6'], ['g1f3', 'g8f6', 'c2c4', 'c7c5', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['g1f3', 'g8f6', 'c2c4', 'c7c5', 'g2g3'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'b8d7'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8b4'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'c1g5'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c5'], ['g1f3', 'g8f6', 'c2c4', 'e7e6', 'g2g3', 'd7d5', 'f1g2', 'f8e7'], ['g1f3', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4'], ['g1f3', 'g8f6', 'c2c4', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['g1f3', 'g8f6', 'd2d4', 'c7c5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'c7c6', 'e2e3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'd7d5', 'c2c4', 'e7e6', 'g2g3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'f8b4', 'b1d2'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'f8b4', 'c1d2'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'f8b4'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'b8d7'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8b4'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'c2c4', 'd7d5', 'g2g3'], ['g1f3', 'g8f6', 'd2d4', 'e7e6', 'g2g3'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'c1g5'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'c2c4', 'f8g7', 'b1c3', 'e8g8', 'e2e4', 'd7d6', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'c2c4', 'f8g7', 'g2g3', 'e8g8', 'f1g2', 'd7d6', 'e1g1'], ['g1f3', 'g8f6', 'd2d4', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['g1f3', 'g8f6', 'g2g3', 'g7g6'], ['g1f3', 'c7c5', 'c2c4', 'b8c6'], ['g1f3', 'c7c5', 'c2c4', 'g8f6', 'b1c3', 'b8c6'], ['g1f3', 'c7c5', 'c2c4', 'g8f6', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['g1f3', 'c7c5', 'c2c4', 'g8f6', 'g2g3'], ['g1f3', 'd7d5', 'c2c4'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'c7c6', 'e2e3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'c1g5'], ['g1f3', 'd7d5', 'd2d4', 'g8f6', 'c2c4', 'e7e6', 'g2g3'], ['g1f3', 'd7d5', 'g2g3'], ['g1f3', 'g7g6'], ['c2c4', 'g8f6', 'b1c3', 'c7c5'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'b8d7'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'f8b4'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c6', 'c1g5'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3', 'd7d5', 'd2d4', 'c7c5'], ['c2c4', 'g8f6', 'b1c3', 'e7e5', 'g1f3', 'b8c6', 'g2g3'], ['c2c4', 'g8f6', 'b1c3', 'g7g6'], ['c2c4', 'g8f6', 'g1f3', 'b7b6', 'g2g3'], ['c2c4', 'g8f6', 'g1f3', 'c7c5', 'b1c3', 'b8c6'], ['c2c4', 'g8f6', 'g1f3', 'c7c5', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['c2c4', 'g8f6', 'g1f3', 'c7c5', 'g2g3'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'b8d7'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8b4'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'c1g5'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c5'], ['c2c4', 'g8f6', 'g1f3', 'e7e6', 'g2g3', 'd7d5', 'f1g2', 'f8e7'], ['c2c4', 'g8f6', 'g1f3', 'g7g6', 'b1c3', 'f8g7', 'e2e4'], ['c2c4', 'g8f6', 'g1f3', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['c2c4', 'c7c6'], ['c2c4', 'c7c5', 'g1f3', 'b8c6'], ['c2c4', 'c7c5', 'g1f3', 'g8f6', 'b1c3', 'b8c6'], ['c2c4', 'c7c5', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'g2g3', 'b7b6', 'f1g2', 'c8b7', 'e1g1', 'f8e7'], ['c2c4', 'c7c5', 'g1f3', 'g8f6', 'g2g3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'g1f3', 'g8f6', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'c1g5', 'f8e7', 'e2e3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'b8d7'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'f8b4'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c6', 'c1g5'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c6',
+    'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'g1f3', 'c7c5'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'g8f6', 'c4d5', 'e6d5', 'c1g5'], ['c2c4', 'e7e6', 'b1c3', 'd7d5', 'd2d4', 'c7c6'], ['c2c4', 'e7e6', 'g1f3'], ['c2c4', 'e7e5', 'b1c3', 'b8c6'], ['c2c4', 'e7e5', 'b1c3', 'g8f6', 'g1f3', 'b8c6', 'g2g3'], ['c2c4', 'e7e5', 'g2g3'], ['c2c4', 'g7g6', 'b1c3'], ['d2d4', 'g8f6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'c7c5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'c7c6', 'e2e3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'd7d5', 'c2c4', 'e7e6', 'g2g3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'f8b4', 'b1d2'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'f8b4', 'c1d2'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'b8d7'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'b1c3', 'c7c5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'c2c4', 'd7d5', 'g2g3'], ['d2d4', 'g8f6', 'g1f3', 'e7e6', 'g2g3'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'c1g5'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'c2c4', 'f8g7', 'b1c3', 'e8g8', 'e2e4', 'd7d6', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'c2c4', 'f8g7', 'g2g3', 'e8g8', 'f1g2', 'd7d6', 'e1g1'], ['d2d4', 'g8f6', 'g1f3', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['d2d4', 'g8f6', 'c2c4', 'c7c5', 'd4d5', 'b7b5', 'c4b5', 'a7a6'], ['d2d4', 'g8f6', 'c2c4', 'c7c5', 'd4d5', 'e7e6', 'b1c3', 'e6d5', 'c4d5', 'd7d6'], ['d2d4', 'g8f6', 'c2c4', 'd7d6', 'b1c3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'd1c2', 'e8g8'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'g1f3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'e2e3', 'c7c5', 'f1d3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4', 'e2e3', 'e8g8', 'f1d3', 'd7d5', 'g1f3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'c1g5', 'f8e7', 'e2e3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'b8d7'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'f8b4'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'g1f3', 'c7c5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'd7d5', 'c4d5', 'e6d5', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'f8b4', 'b1d2'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'f8b4', 'c1d2'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'b8d7'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'f8b4'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'b1c3', 'c7c5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g1f3', 'd7d5', 'g2g3'], ['d2d4', 'g8f6', 'c2c4', 'e7e6', 'g2g3', 'd7d5', 'f1g2'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'f1e2', 'e8g8', 'c1g5'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'f1e2', 'e8g8', 'g1f3', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'g1f3', 'e8g8', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'f8g7', 'e2e4', 'd7d6', 'f2f3', 'e8g8', 'c1e3'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'd7d5', 'g1f3', 'f8g7', 'd1b3', 'd5c4', 'b3c4'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'b1c3', 'd7d5', 'c4d5', 'f6d5', 'e2e4', 'd5c3', 'b2c3', 'f8g7', 'f1c4'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'g1f3', 'f8g7', 'b1c3', 'e8g8', 'e2e4', 'd7d6', 'f1e2', 'e7e5', 'e1g1', 'b8c6', 'd4d5', 'c6e7', 'f3e1', 'f6d7'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'g1f3', 'f8g7', 'g2g3', 'e8g8', 'f1g2', 'd7d6', 'e1g1'], ['d2d4', 'g8f6', 'c2c4', 'g7g6', 'g2g3', 'f8g7', 'f1g2', 'e8g8'], ['d2d4', 'd7d6', 'e2e4', 'g8f6', 'b1c3', 'g7g6', 'f2f4', 'f8g7', 'g1f3'], ['d2d4', 'd7d6', 'e2e4', 'g7g6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'c7c6', 'e2e3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'd5c4', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'b8d7'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'f8b4'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'b1c3', 'c7c5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'g1f3', 'g8f6', 'c2c4', 'e7e6', 'g2g3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4',
+    'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'g1f3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'b1c3', 'g8f6', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'd5c4', 'a2a4', 'c8f5', 'e2e3', 'e7e6', 'f1c4'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'b1c3', 'e7e6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'c7c6', 'g1f3', 'g8f6', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'd5c4', 'g1f3', 'g8f6', 'e2e3', 'e7e6', 'f1c4', 'c7c5', 'e1g1', 'a7a6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'g1f3', 'g8f6', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'f8e7', 'g1f3', 'g8f6', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c1g5', 'f8e7', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'b8d7'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'f8b4'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'g1f3', 'c7c5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c4d5', 'e6d5', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'c7c6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'b8d7'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'f8b4'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'b1c3', 'c7c5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'c1g5'], ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'g1f3', 'g8f6', 'g2g3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'd1c2', 'e8g8'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'g1f3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'e2e3', 'b7b6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'e2e3', 'c7c5', 'f1d3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'f8b4', 'e2e3', 'e8g8', 'f1d3', 'd7d5', 'g1f3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'c1g5', 'f8e7', 'e2e3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'b8d7'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'f8b4'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'g1f3', 'c7c5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'b1c3', 'd7d5', 'c4d5', 'e6d5', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'f8b4', 'b1d2'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'f8b4', 'c1d2'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'b1c3', 'c8b7', 'a2a3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'b1c3', 'f8b4'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'a2a3', 'c8b7', 'b1c3', 'd7d5', 'c4d5', 'f6d5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'g2g3', 'c8b7', 'f1g2', 'f8e7', 'e1g1', 'e8g8', 'b1c3', 'f6e4', 'd1c2', 'e4c3', 'c2c3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'b7b6', 'g2g3', 'c8a6', 'b2b3', 'f8b4', 'c1d2', 'b4e7'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'c7c5', 'd4d5', 'e6d5', 'c4d5', 'd7d6', 'b1c3', 'g7g6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'b8d7'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1f4', 'e8g8', 'e2e3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'h7h6', 'g5h4', 'e8g8', 'e2e3', 'b7b6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8e7', 'c1g5', 'e8g8', 'e2e3', 'h7h6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'f8b4'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'd1c2', 'f8d6'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c6', 'e2e3', 'b8d7', 'f1d3', 'd5c4', 'd3c4', 'b7b5', 'c4d3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'b1c3', 'c7c5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'c1g5'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g1f3', 'd7d5', 'g2g3'], ['d2d4', 'e7e6', 'c2c4', 'g8f6', 'g2g3', 'd7d5', 'f1g2'], ['d2d4', 'f7f5'], ['d2d4', 'g7g6'], ['e2e4', 'g8f6', 'e4e5', 'f6d5', 'd2d4', 'd7d6', 'g1f3'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1c3', 'd5e4', 'c3e4', 'b8d7'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1c3', 'd5e4', 'c3e4', 'c8f5', 'e4g3', 'f5g6', 'h2h4', 'h7h6'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1d2', 'd5e4', 'd2e4', 'b8d7'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'b1d2', 'd5e4', 'd2e4', 'c8f5', 'e4g3', 'f5g6', 'h2h4', 'h7h6'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'e4d5', 'c6d5', 'c2c4', 'g8f6', 'b1c3', 'e7e6', 'g1f3'], ['e2e4', 'c7c6', 'd2d4', 'd7d5', 'e4e5', 'c8f5'], ['e2e4', 'c7c5', 'b1c3', 'b8c6', 'g2g3', 'g7g6', 'f1g2', 'f8g7'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'f1b5'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'c1g5', 'e7e6', 'd1d2', 'f8e7', 'e1c1', 'e8g8'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'c1g5', 'e7e6', 'd1d2', 'a7a6', 'e1c1', 'h7h6'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'f1c4'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'e7e5', 'd4b5', 'd7d6'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'e7e6', 'b1c3', 'd8c7'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'e7e6', 'b1c3', 'a7a6'], ['e2e4', 'c7c5', 'g1f3', 'b8c6', 'd2d4', 'c5d4', 'f3d4', 'g7g6'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'f1b5'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'b8c6', 'c1g5', 'e7e6', 'd1d2', 'f8e7', 'e1c1', 'e8g8'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'b8c6', 'c1g5', 'e7e6', 'd1d2', 'a7a6', 'e1c1', 'h7h6'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'b8c6', 'f1c4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'c1e3'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'c1g5', 'e7e6', 'f2f4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'f1e2', 'e7e5', 'd4b3', 'f8e7'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6', 'f2f4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'e7e6', 'f1e2'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'e7e6', 'g2g4'], ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'g7g6', 'c1e3', 'f8g7', 'f2f3'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'b1c3'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'b8c6', 'b1c3', 'd8c7'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'b8c6', 'b1c3', 'a7a6'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'f1e2'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'd7d6', 'g2g4'], ['e2e4', 'c7c5', 'g1f3', 'e7e6', 'd2d4', 'c5d4', 'f3d4', 'a7a6', 'f1d3'], ['e2e4', 'c7c5', 'c2c3'], ['e2e4', 'd7d6', 'd2d4', 'g8f6', 'b1c3', 'g7g6', 'f2f4', 'f8g7', 'g1f3'], ['e2e4', 'd7d6', 'd2d4', 'g7g6'], ['e2e4', 'd7d5', 'e4d5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1c3', 'f8b4', 'e4e5', 'c7c5', 'a2a3', 'b4c3', 'b2c3', 'g8e7'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1c3', 'g8f6', 'c1g5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1d2', 'g8f6', 'e4e5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1d2', 'c7c5', 'g1f3'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'b1d2', 'c7c5', 'e4d5', 'e6d5'], ['e2e4', 'e7e6', 'd2d4', 'd7d5', 'e4e5', 'c7c5', 'c2c3', 'b8c6', 'g1f3'], ['e2e4', 'e7e5', 'b1c3'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'b1c3', 'g8f6', 'f1b5'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'f8c5'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'g8f6'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'g8f6', 'e1g1'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5c6', 'd7c6', 'e1g1'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'd7d6', 'c2c3', 'e8g8', 'h2h3', 'c6b8', 'd2d4', 'b8d7'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'd7d6', 'c2c3', 'e8g8', 'h2h3', 'c6a5',
+    'b3c2', 'c7c5', 'd2d4', 'd8c7', 'b1d2'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'd7d6', 'c2c3', 'e8g8', 'h2h3', 'c8b7', 'd2d4', 'f8e8'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'e8g8', 'c2c3', 'd7d6', 'h2h3', 'c6b8', 'd2d4', 'b8d7'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'e8g8', 'c2c3', 'd7d6', 'h2h3', 'c6a5', 'b3c2', 'c7c5', 'd2d4', 'd8c7', 'b1d2'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f8e7', 'f1e1', 'b7b5', 'a4b3', 'e8g8', 'c2c3', 'd7d6', 'h2h3', 'c8b7', 'd2d4', 'f8e8'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'g8f6', 'e1g1', 'f6e4', 'd2d4', 'b7b5', 'a4b3', 'd7d5', 'd4e5', 'c8e6', 'c2c3'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6', 'b5a4', 'd7d6'], ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'd2d4', 'e5d4', 'f3d4'], ['e2e4', 'e7e5', 'g1f3', 'g8f6', 'f3e5', 'd7d6', 'e5f3', 'f6e4', 'd2d4'], ['e2e4', 'e7e5', 'f2f4'], ['e2e4', 'g7g6', 'd2d4', 'f8g7', 'b1c3', 'd7d6'], ['g2g3']]
+
+# The book always opens with this move as white
+BOOK_FIRST_MOVE = "e2e4"
+BOOK_DEPTH = max(len(line) for line in TSCP_OPENINGS)
+
+
+def build_book_trie(lines):
+    """Nested dicts keyed by UCI move, one path per opening line"""
+    trie = {}
+    for line in lines:
+        node = trie
+        for uci in line:
+            node = node.setdefault(uci, {})
+    return trie
+
+
+def build_book_index(trie):
+    """
+    Map the Polyglot Zobrist hash of every position in the book to the UCI
+    moves played from it, so a position is found whichever line reached it
+    """
+    index = {}
+    board = chess.Board()
+    # The lines share about a hundred distinct moves; parse each only once
+    parsed = {}
+
+    def walk(node):
+        if not node:
+            return
+        moves = index.setdefault(chess.polyglot.zobrist_hash(board), [])
+        for uci, child in node.items():
+            if uci not in moves:
+                moves.append(uci)
+            move = parsed.get(uci)
+            if move is None:
+                move = parsed[uci] = chess.Move.from_uci(uci)
+            board.push(move)
+            walk(child)
+            board.pop()
+
+    walk(trie)
+    index[chess.polyglot.zobrist_hash(board)] = [BOOK_FIRST_MOVE]
+    return index
+
+
+BOOK_MOVES = build_book_index(build_book_trie(TSCP_OPENINGS))
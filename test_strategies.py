@@ -0,0 +1,147 @@
+import random
+import time
+
+import chess
+import chess.polyglot
+import chess.variant
+import pytest
+
+from strategies import MATE, MAX_PLY, Move, SCORE_EG, SCORE_MG, TT_EXACT
+
+
+START_FENS = [
+    chess.STARTING_FEN,
+    # Both sides a move from promoting, with captures onto the back rank
+    "1n2k3/P1P4P/8/8/8/8/p1p4p/1N2K3 w - - 0 1",
+    # En passant available on the first move
+    "rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3",
+]
+
+
+def make_engine():
+    engine = Move(None, {}, None)
+    engine.in_book = False
+    return engine
+
+
+def assert_in_sync(engine, board):
+    assert engine.zobrist_key(board) == chess.polyglot.zobrist_hash(board)
+    assert engine.eval_mg == engine.evaluate_board(board, SCORE_MG)
+    assert engine.eval_eg == engine.evaluate_board(board, SCORE_EG)
+    assert engine.mailbox == [board.piece_type_at(square) for square in chess.SQUARES]
+
+
+def play_random(board, seed, plies=80):
+    rng = random.Random(seed)
+    engine = make_engine()
+    engine.reset_position(board)
+    pushed = 0
+    for _ in range(plies):
+        moves = list(board.legal_moves)
+        if not moves:
+            break
+        if not board.is_check() and rng.random() < 0.1:
+            move = chess.Move.null()
+        else:
+            move = rng.choice(moves)
+        engine.push_move(board, move)
+        pushed += 1
+        assert_in_sync(engine, board)
+        # Undo and redo now and then, so pop_move is checked mid-game too
+        if rng.random() < 0.3:
+            engine.pop_move(board)
+            assert_in_sync(engine, board)
+            engine.push_move(board, move)
+    for _ in range(pushed):
+        engine.pop_move(board)
+        assert_in_sync(engine, board)
+
+
+@pytest.mark.parametrize("fen", START_FENS)
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_state_matches_board(fen, seed):
+    play_random(chess.Board(fen), seed)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_state_matches_board_chess960(seed):
+    play_random(chess.Board.from_chess960_pos(seed * 47 % 960), seed)
+
+
+def test_aborted_search_restores_board():
+    board = chess.Board("r1bq1rk1/pp2bppp/2n1pn2/3p4/2PP4/2N1PN2/P3BPPP/R1BQK2R w KQ - 0 9")
+    board.push_uci("e1g1")
+    fen = board.fen()
+    stack_size = len(board.move_stack)
+    engine = make_engine()
+    # The clock runs out partway through a deepening pass
+    move = engine.minimax_root(MAX_PLY - 1, board, time.monotonic() + 0.05)
+    assert board.fen() == fen
+    assert len(board.move_stack) == stack_size
+    assert engine.undo_stack == []
+    assert move in board.legal_moves
+
+
+@pytest.mark.parametrize("value", [MATE - 5, -MATE + 5])
+def test_tt_mate_scores_shift_with_ply(value):
+    board = chess.Board()
+    engine = make_engine()
+    engine.reset_position(board)
+    key, _ = engine.tt_probe(board, 2)
+    engine.tt_store(key, 1, value, TT_EXACT, None, 2)
+    _, entry = engine.tt_probe(board, 6)
+    assert entry.value == value + (4 if value < 0 else -4)
+
+
+@pytest.mark.parametrize("fen", [
+    "k7/8/2K5/8/8/8/8/6Q1 w - - 0 1",
+    "7k/8/5K2/8/8/8/8/Q7 w - - 0 1",
+])
+def test_search_scores_mate_distance(fen):
+    # Mate in two: checkmate lands on the third ply
+    board = chess.Board(fen)
+    engine = make_engine()
+    engine.reset_position(board)
+    # Fill the table from every reply first, so the root search reuses
+    # mate scores that were stored one ply closer to their own root
+    for move in list(board.legal_moves):
+        engine.push_move(board, move)
+        engine.negamax(4, board, -MATE, MATE, 0)
+        engine.pop_move(board)
+    assert engine.negamax(5, board, -MATE, MATE, 0) == MATE - 3
+
+
+def test_repeated_search_avoids_draw_claim():
+    board = chess.Board("8/8/8/4k3/8/8/3QK3/8 w - - 0 1")
+    engine = make_engine()
+    move = engine.search(board)
+    # Walk the king out and back twice, so repeating the move allows a claim
+    for _ in range(2):
+        for uci in (move.uci(), "e5e6", move.uci()[2:] + move.uci()[:2], "e6e5"):
+            board.push_uci(uci)
+    move = engine.search(board)
+    board.push(move)
+    assert not board.can_claim_draw()
+
+
+def test_search_on_variant_board():
+    # A crazyhouse position with a pawn in each pocket, so the tree has drops
+    board = chess.variant.CrazyhouseBoard(
+        "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[Pp] w KQkq - 0 3")
+    fen = board.fen()
+    move = make_engine().search(board)
+    assert move in board.legal_moves
+    assert board.fen() == fen
+
+
+@pytest.mark.parametrize("variant", [chess.variant.GiveawayBoard, chess.variant.AtomicBoard])
+def test_book_only_used_for_standard_chess(variant):
+    # After 1. d4 d5 2. c4 the book answers c6 or e6, but in giveaway the
+    # capture dxc4 is forced
+    board = variant()
+    for uci in ("d2d4", "d7d5", "c2c4"):
+        board.push_uci(uci)
+    engine = Move(None, {}, None)
+    move = engine.search(board)
+    assert move in board.legal_moves
+    assert not engine.in_book